@@ -1,4 +1,50 @@
 """A minimal, scriptable genome browser for python."""
 
-from ._api import Browser, Config, browse, load, loads, locus, ref, track  # noqa: F401
-from ._version import __version__  # noqa: F401
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+from ._version import __version__
+
+if TYPE_CHECKING:
+    from ._api import Config, browse, load, loads, locus, ref, track
+    from ._browser import Browser
+
+__all__ = [
+    "Browser",
+    "Config",
+    "__version__",
+    "browse",
+    "load",
+    "loads",
+    "locus",
+    "ref",
+    "track",
+]
+
+# Resolved on first access so that `import pygv` doesn't pull in the widget
+# (anywidget, ipywidgets) and file server (servir) dependencies up front.
+_LAZY = {
+    "Browser": "._browser",
+    "Config": "._api",
+    "browse": "._api",
+    "load": "._api",
+    "loads": "._api",
+    "locus": "._api",
+    "ref": "._api",
+    "track": "._api",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name not in _LAZY:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return __all__
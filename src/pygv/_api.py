@@ -5,11 +5,15 @@ import json
 import pathlib
 import typing
 
-from ._browser import Browser
-from ._config import Config, is_href
+import msgspec
+
+from ._config import Config, is_href, track_from_dict
 from ._tracks import Track
 
-__all__ = ["Browser", "browse", "load", "loads", "locus", "ref", "track"]
+if typing.TYPE_CHECKING:
+    from ._browser import Browser
+
+__all__ = ["Config", "browse", "load", "loads", "locus", "ref", "track"]
 
 
 @dataclasses.dataclass
@@ -28,6 +32,9 @@ TrackArgument = typing.Union[
     Track,
 ]
 
+_PATH_TYPES = (str, pathlib.Path)
+_TRACK_CLASSES = typing.get_args(Track)
+
 
 def locus(locus: str) -> None:
     """Set the initial locus for the browsers in this session."""
@@ -40,22 +47,25 @@ def ref(genome: str) -> None:
 
 
 def track(targ: TrackArgument | None = None, /, **kwargs) -> Track:  # noqa: ANN003
-    if isinstance(targ, Track):
+    if isinstance(targ, _TRACK_CLASSES):
         return targ
 
     if targ is None:
-        url = kwargs["url"]
-    elif isinstance(targ, (str, pathlib.Path)):
-        url = kwargs["url"] = str(targ)
-        kwargs["indexURL"] = None
+        source = kwargs["url"]
+    elif isinstance(targ, _PATH_TYPES):
+        source = targ
     else:
-        url = kwargs["url"] = str(targ[0])
-        kwargs["indexURL"] = str(targ[1])
+        source, index = targ
+        kwargs["indexURL"] = str(index)
+    url = kwargs["url"] = str(source)
 
     if "name" not in kwargs:
-        kwargs["name"] = url if is_href(url) else pathlib.Path(url).name
+        if isinstance(source, pathlib.Path):
+            kwargs["name"] = source.name
+        else:
+            kwargs["name"] = url if is_href(url) else pathlib.PurePath(url).name
 
-    return Config.from_dict({"tracks": [kwargs]}).tracks[0]
+    return track_from_dict(kwargs)
 
 
 def browse(*tracks: TrackArgument) -> Browser:
@@ -71,6 +81,8 @@ def browse(*tracks: TrackArgument) -> Browser:
     Browser
         The browser widget.
     """
+    from ._browser import Browser  # noqa: PLC0415
+
     _CONTEXT.current = Browser(
         Config(
             genome=_CONTEXT.genome,
@@ -81,13 +93,23 @@ def browse(*tracks: TrackArgument) -> Browser:
     return _CONTEXT.current
 
 
-def load(file: typing.IO[str]) -> Browser:
+def load(file: typing.IO[typing.AnyStr]) -> Browser:
     """Load an existing IGV configuration from a file-like."""
     return loads(file.read())
 
 
-def loads(json_config: str) -> Browser:
-    """Load a JSON-encoded IGV configuration."""
-    config = json.loads(json_config)
+def loads(json_config: str | bytes) -> Browser:
+    """Load a JSON-encoded IGV configuration.
+
+    Text is parsed with the standard library, which accepts the `NaN` and
+    `Infinity` literals written by `json.dump`. Bytes are decoded with the
+    faster (but strict) `msgspec.json.decode`, which rejects them.
+    """
+    from ._browser import Browser  # noqa: PLC0415
+
+    if isinstance(json_config, str):
+        config = json.loads(json_config)
+    else:
+        config = msgspec.json.decode(json_config)
     _CONTEXT.current = Browser(Config.from_dict(config))
     return _CONTEXT.current
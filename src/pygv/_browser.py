@@ -10,15 +10,19 @@ import traitlets
 if TYPE_CHECKING:
     from ._config import Config
 
+_ESM = pathlib.Path(__file__).parent / "static" / "widget.js"
+_TRACKS_ENCODER = msgspec.json.Encoder()
+
 
 class Browser(anywidget.AnyWidget):
-    _esm = pathlib.Path(__file__).parent / "static" / "widget.js"
+    _esm = _ESM
 
     _genome = traitlets.Unicode().tag(sync=True)
     _locus = traitlets.Unicode().tag(sync=True)
     _tracks = traitlets.List().tag(
         sync=True,
-        to_json=lambda x, _: msgspec.to_builtins(x),
+        # synced as a single JSON-encoded binary buffer (decoded in widget.js)
+        to_json=lambda x, _: _TRACKS_ENCODER.encode(x),
     )
 
     def __init__(self, config: Config) -> None:
@@ -1,5 +1,6 @@
-import copy
+import functools
 import pathlib
+import sys
 import typing as t
 
 import msgspec
@@ -9,50 +10,70 @@ from msgspec import UNSET, Struct, UnsetType
 from ._tracks import Track
 
 _PROVIDER = servir.Provider()
-_RESOURCES = set()
+# The provider only holds weak references, so keep each resource alive here.
+_RESOURCES: dict[pathlib.Path, servir.Resource] = {}
+_HREF_PREFIXES = ("http://", "https://")
 
 FilePathOrUrl = t.Union[str, pathlib.Path]
 
 
-class Config(Struct, rename="camel", repr_omit_defaults=True, omit_defaults=True):
+class Config(
+    Struct,
+    rename="camel",
+    repr_omit_defaults=True,
+    omit_defaults=True,
+    gc=False,
+):
     """An IGV configuration."""
 
     genome: t.Union[str, UnsetType] = UNSET  # noqa: FA100
     locus: t.Union[str, list[str], UnsetType] = UNSET  # noqa: FA100
     show_sample_names: t.Union[bool, UnsetType] = UNSET  # noqa: FA100
-    tracks: list[Track] = []
+    tracks: list[Track] = msgspec.field(default_factory=list)
 
     @classmethod
     def from_dict(
         cls,
         config: dict,
     ) -> "Config":
-        config = copy.deepcopy(config)
-
-        for track in config.get("tracks", []):
-            track["type"] = resolve_track_type(
-                track.get("type"),
-                track.get("format", guess_format(track.get("url"))),
-            )
-
-        return msgspec.convert(config, type=Config)
+        tracks = [_with_track_type(track) for track in config.get("tracks", [])]
+        return msgspec.convert({**config, "tracks": tracks}, type=Config)
 
     def servable(self) -> "Config":
         """Returns a new config with tracks that are ensured to be servable."""  # noqa: D401
-        copy = msgspec.convert(msgspec.to_builtins(self), type=Config)
+        tracks = []
+
+        for track in self.tracks:
+            changes = {}
+
+            if track.url is not UNSET:
+                changes["url"] = resolve_file_or_url(track.url)
+
+            if track.index_url is not UNSET:
+                changes["index_url"] = resolve_file_or_url(track.index_url)
 
-        for track in copy.tracks:
-            if track.url != msgspec.UNSET:
-                track.url = resolve_file_or_url(track.url)
+            tracks.append(msgspec.structs.replace(track, **changes))
 
-            if track.index_url != msgspec.UNSET:
-                track.index_url = resolve_file_or_url(track.index_url)
+        return msgspec.structs.replace(self, tracks=tracks)
 
-        return copy
+
+def track_from_dict(track: dict) -> Track:
+    """Convert a single track configuration into a `Track`."""
+    return msgspec.convert(_with_track_type(track), type=Track)
+
+
+def _with_track_type(track: dict) -> dict:
+    return {
+        **track,
+        "type": resolve_track_type(
+            track.get("type"),
+            track.get("format", guess_format(track.get("url"))),
+        ),
+    }
 
 
 def is_href(s: str) -> bool:
-    return s.startswith(("http", "https"))
+    return s.startswith(_HREF_PREFIXES)
 
 
 def resolve_file_or_url(path_or_url: t.Union[str, pathlib.Path]) -> str:  # noqa: FA100
@@ -73,65 +94,76 @@ def resolve_file_or_url(path_or_url: t.Union[str, pathlib.Path]) -> str:  # noqa
     if is_href(normalized):
         return normalized
     path = pathlib.Path(normalized).resolve()
-    if not path.is_file() or not path.exists():
+    if not path.is_file():
         raise FileNotFoundError(path)
-    resource = _PROVIDER.create(path)
-    _RESOURCES.add(resource)
+    resource = _RESOURCES.get(path)
+    if resource is None:
+        resource = _RESOURCES[path] = _PROVIDER.create(path)
     return resource.url
 
 
-def resolve_track_type(  # noqa: C901, PLR0911, PLR0912
+_TRACK_TYPES = frozenset(
+    {
+        "annotation",
+        "wig",
+        "alignment",
+        "variant",
+        "mut",
+        "seg",
+        "gwas",
+        "interact",
+        "qtl",
+        "junction",
+        "cnvpytor",
+        "arc",
+        "merged",
+    }
+)
+
+_FORMATS_BY_TYPE = (
+    ("annotation", ("bed", "gff", "gff3", "gtf", "bedpe")),
+    ("wig", ("bigWig", "bigwig", "bw", "bg", "bedGraph", "bedgraph")),
+    ("alignment", ("bam", "cram")),
+    ("variant", ("vcf",)),
+    ("mut", ("mut", "maf")),
+    ("seg", ("mut", "seg")),
+    ("gwas", ("bed", "gwas")),
+    ("interact", ("bedpe", "interact", "bigInteract", "biginteract")),
+    ("qtl", ("qtl",)),
+    ("junction", ("bed",)),
+    ("cnvpytor", ("pytor", "vcf")),
+    ("arc", ("bp", "bed")),
+)
+
+# Formats shared by several track types (e.g. "bed") resolve to the first type
+# listed above, so the table is built in reverse to let earlier entries win.
+_FORMAT_TO_TYPE = {
+    format_: type_
+    for type_, formats in reversed(_FORMATS_BY_TYPE)
+    for format_ in formats
+}
+
+
+def resolve_track_type(
     type_: t.Union[str, None],  # noqa: FA100
     format_: t.Union[str, None],  # noqa: FA100
 ) -> str:
-    if type_ == "annotation" or format_ in {"bed", "gff", "gff3", "gtf", "bedpe"}:
-        return "annotation"
-
-    if type_ == "wig" or format_ in {"bigWig", "bw", "bg", "bedGraph"}:
-        return "wig"
-
-    if type_ == "alignment" or format_ in {"bam", "cram"}:
-        return "alignment"
-
-    if type_ == "variant" or format_ in {"vcf"}:
-        return "variant"
-
-    if type_ == "mut" or format_ in {"mut", "maf"}:
-        return "mut"
-
-    if type_ == "seg" or format_ in {"mut", "seg"}:
-        return "seg"
-
-    if type_ == "gwas" or format_ in {"bed", "gwas"}:
-        return "gwas"
-
-    if type_ == "interact" or format_ in {"bedpe", "interact", "bigInteract"}:
-        return "interact"
-
-    if type_ == "qtl" or format_ in {"qtl"}:
-        return "qtl"
-
-    if type_ == "junction" or format_ in {"bed"}:
-        return "junction"
-
-    if type_ == "cnvpytor" or format_ in {"pytor", "vcf"}:
-        return "cnvpytor"
-
-    if type_ == "arc" or format_ in {"bp", "bed"}:
-        return "arc"
+    if type_ in _TRACK_TYPES:
+        return type_
 
-    if type_ == "merged":
-        return "merged"
+    resolved = _FORMAT_TO_TYPE.get(format_)
+    if resolved is None:
+        msg = f"Unknown track type, got: type={type_!r}, format={format_!r}"
+        raise ValueError(msg)
 
-    msg = "Unknown track type, got: {}"
-    raise ValueError(msg)
+    return resolved
 
 
+@functools.lru_cache(maxsize=1024)
 def guess_format(filename: t.Union[str, None]) -> t.Union[str, None]:  # noqa: FA100
     if filename is None:
         return None
-    parts = filename.split(".")
-    filetype = parts[-1].lower()
+    filetype = filename.rpartition(".")[2].lower()
     if filetype == "gz":
-        filetype = parts[-2].lower()
-    return filetype
+        filetype = filename[:-3].rpartition(".")[2].lower()
+    return sys.intern(filetype)
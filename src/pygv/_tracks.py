@@ -9,6 +9,7 @@ __all__ = [
     "AnnotationTrack",
     "ArcTrack",
     "CnvPytorTrack",
+    "GwasTrack",
     "InteractTrack",
     "MergedTrack",
     "MutationTrack",
@@ -21,10 +22,21 @@ __all__ = [
 ]
 
 
-class BaseTrack(Struct, rename="camel", repr_omit_defaults=True, omit_defaults=True):
+class BaseTrack(
+    Struct,
+    rename="camel",
+    repr_omit_defaults=True,
+    omit_defaults=True,
+    frozen=True,
+    gc=False,
+):
     """Represents a browser track.
 
     For a full configuration options, see the [IGV.js docs](https://igv.org/doc/igvjs/#tracks/Tracks)
+
+    Track fields are frozen, but list-valued options (e.g., `samples`) are
+    ordinary lists and can still be mutated in place. Use
+    `msgspec.structs.replace` to derive a track with different options.
     """
 
     url: t.Union[str, UnsetType] = UNSET
@@ -184,7 +196,7 @@ class AnnotationTrack(BaseTrack, tag="annotation"):
     """
 
 
-class GuideLine(Struct):
+class GuideLine(Struct, frozen=True, gc=False):
     """Represents a horizontal guide line."""
 
     color: str
@@ -218,7 +230,7 @@ class WigTrack(BaseTrack, tag="wig"):
     ```
     """
 
-    autoscale: t.Union[bool, None] = None
+    autoscale: t.Union[bool, UnsetType] = UNSET
     """Autoscale track to maximum value in view."""
 
     autoscale_group: t.Union[str, UnsetType] = UNSET
@@ -263,7 +275,7 @@ class WigTrack(BaseTrack, tag="wig"):
     """
 
 
-class AlignmentSorting(Struct, rename="camel"):
+class AlignmentSorting(Struct, rename="camel", frozen=True, gc=False):
     """Represents initial sort order of packed alignment rows."""
 
     chr: str
@@ -282,7 +294,7 @@ class AlignmentSorting(Struct, rename="camel"):
     """Sort directions."""
 
 
-class AlignmentFiltering(Struct, rename="camel"):
+class AlignmentFiltering(Struct, rename="camel", frozen=True, gc=False):
     """Represents filtering options for alignments."""
 
     vendor_failed: bool = True
@@ -300,7 +312,7 @@ class AlignmentFiltering(Struct, rename="camel"):
     mq: int = 0
     """Filter alignments with mapping quality less than the supplied value."""
 
-    readgroups: t.Union[set[str], UnsetType] = UNSET
+    readgroups: t.Union[frozenset[str], UnsetType] = UNSET
     """Read groups ('RG' tag). If present, filter alignments not matching this set."""
 
 
@@ -524,9 +536,6 @@ class VariantTrack(BaseTrack, tag="variant"):
 
     # Variant color options
 
-    color: t.Union[str, UnsetType] = UNSET
-    """A CSS color value for a variant."""
-
     color_by: t.Union[str, UnsetType] = UNSET
     """Specify an `INFO` field to color variants by.
 
@@ -581,7 +590,7 @@ class MutationTrack(BaseTrack, tag="mut"):
     """The track display mode. Default `"EXPANDED"`."""
 
 
-class SegmentedCopyNumberSorting(Struct, rename="camel"):
+class SegmentedCopyNumberSorting(Struct, rename="camel", frozen=True, gc=False):
     """Represents initial sort order of segmented copy number rows."""
 
     chr: str
@@ -650,7 +659,7 @@ class SegmentedCopyNumberTrack(BaseTrack, tag="seg"):
     """The initial sort order."""
 
 
-class GwasColumns(Struct, rename="camel"):
+class GwasColumns(Struct, rename="camel", frozen=True, gc=False):
     """Declaration of column number for chrom, position, & value."""
 
     chromosome: int
@@ -1022,7 +1031,7 @@ class MergedTrack(BaseTrack, tag="merged"):
     ```
     """
 
-    tracks: list[WigTrack] = []
+    tracks: list[WigTrack] = field(default_factory=list)
     """Child wig tracks."""
 
     alpha: t.Union[float, UnsetType] = UNSET
@@ -1059,6 +1068,7 @@ Track = t.Union[
     VariantTrack,
     MutationTrack,
     SegmentedCopyNumberTrack,
+    GwasTrack,
     InteractTrack,
     QtlTrack,
     SpliceJunctionTrack,
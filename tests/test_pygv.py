@@ -1,14 +1,18 @@
 import json
+import math
 import pathlib
 
+import msgspec
 import pytest
 from inline_snapshot import snapshot
 
 from pygv import Config
-from pygv._api import load
+from pygv._api import load, loads, track
+from pygv._config import guess_format, resolve_file_or_url, resolve_track_type
 from pygv._tracks import (
     AlignmentTrack,
     AnnotationTrack,
+    GwasTrack,
     MergedTrack,
     SegmentedCopyNumberTrack,
     WigTrack,
@@ -46,11 +50,12 @@ def test_loads_config(config_dict: dict) -> None:
             ],
         )
     )
+    assert "type" not in config_dict["tracks"][0]
 
 
 def test_loads_file(config_dict: dict, tmp_path: pathlib.Path) -> None:
     path = tmp_path / "config.json"
-    path.write_text(json.dumps(config_dict), encoding="utf-8")
+    path.write_bytes(msgspec.json.encode(config_dict))
 
     with path.open() as f:
         browser = load(f)
@@ -67,6 +72,27 @@ def test_loads_file(config_dict: dict, tmp_path: pathlib.Path) -> None:
             )
         ]
     )
+    assert json.loads(browser.get_state()["_tracks"]) == snapshot(
+        [
+            {
+                "type": "alignment",
+                "url": "https://s3.amazonaws.com/1000genomes/data/HG00103/alignment/HG00103.alt_bwamem_GRCh38DH.20150718.GBR.low_coverage.cram",
+                "name": "HG00103",
+                "indexURL": "https://s3.amazonaws.com/1000genomes/data/HG00103/alignment/HG00103.alt_bwamem_GRCh38DH.20150718.GBR.low_coverage.cram.crai",
+                "format": "cram",
+            }
+        ]
+    )
+
+
+def test_loads_binary_file(config_dict: dict, tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "config.json"
+    path.write_bytes(msgspec.json.encode(config_dict))
+
+    with path.open("rb") as f:
+        browser = load(f)
+
+    assert browser._tracks == Config.from_dict(config_dict).tracks  # noqa: SLF001
 
 
 def test_merged() -> None:
@@ -269,3 +295,122 @@ def test_basic_config():
             ],
         )
     )
+
+
+@pytest.mark.parametrize(
+    ("type_", "format_", "expected"),
+    [
+        (None, "bam", "alignment"),
+        (None, "bigwig", "wig"),
+        (None, "bigWig", "wig"),
+        (None, "bed", "annotation"),
+        (None, "vcf", "variant"),
+        (None, "mut", "mut"),
+        ("gwas", "bed", "gwas"),
+        ("junction", "bed", "junction"),
+        ("merged", None, "merged"),
+    ],
+)
+def test_resolve_track_type(type_, format_, expected) -> None:
+    assert resolve_track_type(type_, format_) == expected
+
+
+def test_resolve_track_type_unknown() -> None:
+    with pytest.raises(ValueError, match="Unknown track type"):
+        resolve_track_type(None, "txt")
+
+
+@pytest.mark.parametrize(
+    ("filename", "expected"),
+    [
+        ("reads.bam", "bam"),
+        ("https://example.com/data/genes.v2.BED.gz", "bed"),
+        ("calls.vcf.gz", "vcf"),
+        ("signal.bigWig", "bigwig"),
+        (None, None),
+    ],
+)
+def test_guess_format(filename, expected) -> None:
+    assert guess_format(filename) == expected
+
+
+def test_track() -> None:
+    assert track("data/10x_cov.bw", autoscale=True) == snapshot(
+        WigTrack(url="data/10x_cov.bw", name="10x_cov.bw", autoscale=True)
+    )
+    assert track("gwas/hits.gwas") == snapshot(
+        GwasTrack(url="gwas/hits.gwas", name="hits.gwas")
+    )
+    assert track("data/reads.bam/", format="bam") == snapshot(
+        AlignmentTrack(url="data/reads.bam/", name="reads.bam", format="bam")
+    )
+    assert track(
+        ("https://example.com/reads.bam", "https://example.com/reads.bam.bai")
+    ) == snapshot(
+        AlignmentTrack(
+            url="https://example.com/reads.bam",
+            name="https://example.com/reads.bam",
+            index_url="https://example.com/reads.bam.bai",
+        )
+    )
+
+
+def test_resolve_file_or_url(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "reads.bam"
+    path.write_bytes(b"")
+    config = Config(tracks=[AlignmentTrack(url=str(path))])
+
+    url = resolve_file_or_url(path)
+    assert resolve_file_or_url(str(path)) == url
+    assert config.servable().tracks[0].url == url
+    assert resolve_file_or_url("https://example.com/reads.bam") == snapshot(
+        "https://example.com/reads.bam"
+    )
+
+    path.unlink()
+    with pytest.raises(FileNotFoundError):
+        resolve_file_or_url(path)
+    with pytest.raises(FileNotFoundError):
+        config.servable()
+
+
+def test_servable(tmp_path: pathlib.Path) -> None:
+    bam, bai = tmp_path / "reads.bam", tmp_path / "reads.bam.bai"
+    bam.write_bytes(b"")
+    bai.write_bytes(b"")
+    local = AlignmentTrack(url=str(bam), index_url=str(bai))
+    remote = WigTrack(url="https://example.com/cov.bw")
+    config = Config(genome="hg38", tracks=[local, remote])
+
+    servable = config.servable()
+
+    assert servable.genome == "hg38"
+    assert servable.tracks[0].url != str(bam)
+    assert servable.tracks[0] == AlignmentTrack(
+        url=resolve_file_or_url(bam), index_url=resolve_file_or_url(bai)
+    )
+    assert servable.tracks[1] == remote
+    assert config.tracks == [local, remote]
+
+
+def test_track_validation() -> None:
+    with pytest.raises(msgspec.ValidationError):
+        track("a.bw", autoscale=1)
+    assert track("a.bw", height=50) == WigTrack(url="a.bw", name="a.bw", height=50)
+    with pytest.raises(msgspec.ValidationError):
+        track("a.bw", height=50.0)
+
+
+def test_track_not_shared() -> None:
+    track("x.vcf", samples=("s1",)).samples.append("s2")
+    assert track("x.vcf", samples=("s1",)).samples == ["s1"]
+    track("m.bw", type="merged").tracks.append(WigTrack(url="a.bw"))
+    assert track("m.bw", type="merged").tracks == []
+
+
+def test_loads_non_finite() -> None:
+    qtl = '{"url": "https://example.com/a.qtl", "min": NaN}'
+    config = f'{{"genome": "hg38", "locus": "chr1", "tracks": [{qtl}]}}'
+    assert math.isnan(loads(config)._tracks[0].min)  # noqa: SLF001
+    with pytest.raises(msgspec.DecodeError):
+        loads(config.encode())